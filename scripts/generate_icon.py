@@ -7,51 +7,113 @@ Usage:
 """
 
 import argparse
+import functools
+import json
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, List, Optional, Tuple
 
+import objc
 from AppKit import (
-    NSBezierPath,
-    NSBitmapImageRep,
     NSColor,
-    NSCompositingOperationSourceOver,
     NSFontWeightHeavy,
-    NSGradient,
     NSGraphicsContext,
     NSImage,
+    NSImageHintCTM,
     NSImageSymbolConfiguration,
-    NSMakeRect,
-    NSPNGFileType,
 )
-from Foundation import NSPoint, NSSize
+from CoreFoundation import CFURLCreateFromFileSystemRepresentation
+from Foundation import NSAffineTransform
+from Quartz import (
+    CGBitmapContextCreate,
+    CGBitmapContextCreateImage,
+    CGColorCreate,
+    CGColorSpaceCreateDeviceRGB,
+    CGColorSpaceCreateWithName,
+    CGContextAddPath,
+    CGContextClip,
+    CGContextDrawImage,
+    CGContextDrawLinearGradient,
+    CGContextFillPath,
+    CGContextRestoreGState,
+    CGContextSaveGState,
+    CGContextScaleCTM,
+    CGContextSetFillColorWithColor,
+    CGContextTranslateCTM,
+    CGGradientCreateWithColorComponents,
+    CGImageDestinationAddImage,
+    CGImageDestinationCreateWithURL,
+    CGImageDestinationFinalize,
+    CGImageGetHeight,
+    CGImageGetWidth,
+    CGPathAddCurveToPoint,
+    CGPathAddLineToPoint,
+    CGPathCloseSubpath,
+    CGPathCreateMutable,
+    CGPathMoveToPoint,
+    CGRectMake,
+    kCGColorSpaceGenericRGB,
+    kCGImageAlphaPremultipliedLast,
+    kCGImagePropertyPNGCompressionFilter,
+    kCGImagePropertyPNGDictionary,
+)
+
+# PyObjC exposes CoreGraphics refs as opaque proxy objects; alias for readability
+CGImage = Any  # CGImageRef
+CGPath = Any  # CGMutablePathRef
+
+# IMAGEIO_PNG_FILTER_NONE: skip ImageIO's per-scanline filter selection when encoding
+PNG_FILTER_NONE = 0x08
+
+# Icon colors, created once at import rather than on every create_icon call. The
+# background uses immutable CoreGraphics objects so the worker threads can share them;
+# generic RGB matches the calibrated NSColors these were originally specified as
+GENERIC_RGB = CGColorSpaceCreateWithName(kCGColorSpaceGenericRGB)
+# Linear gradient from white (bottom) to 0.95 gray (top) for a subtle 3D effect
+BACKGROUND_GRADIENT = CGGradientCreateWithColorComponents(
+    GENERIC_RGB,
+    (1.0, 1.0, 1.0, 1.0, 0.95, 0.95, 0.95, 1.0),
+    (0.0, 1.0),
+    2,
+)
+# Midpoint of the gradient, used as a flat fill at small sizes
+BACKGROUND_FLAT_COLOR = CGColorCreate(GENERIC_RGB, (0.975, 0.975, 0.975, 1.0))
+
+SYMBOL_COLOR = NSColor.colorWithCalibratedRed_green_blue_alpha_(0.18, 0.18, 0.18, 1.0)
+SYMBOL_COLOR_CONFIG = NSImageSymbolConfiguration.configurationWithHierarchicalColor_(
+    SYMBOL_COLOR
+)
+
+# Apple's magic constant for radius limiting
+LIMIT_FACTOR = 1.52866483
 
+# Control point multipliers (relative to limited radius)
+# These define the continuous curvature Bézier segments
+TOP_RIGHT_P1 = 1.52866483
+TOP_RIGHT_P2 = 1.08849323
+TOP_RIGHT_P3 = 0.86840689
+TOP_RIGHT_P4 = 0.66993427
+TOP_RIGHT_P5 = 0.63149399
+TOP_RIGHT_P6 = 0.37282392
+TOP_RIGHT_P7 = 0.16906013
+TOP_RIGHT_P8 = 0.07491176
 
-def create_squircle_path(x: float, y: float, width: float, height: float) -> NSBezierPath:
+TOP_RIGHT_CP1 = 0.06549600
+TOP_RIGHT_CP2 = 0.07491100
+TOP_RIGHT_CP3 = 0.16905899
+TOP_RIGHT_CP4 = 0.37282401
+TOP_RIGHT_CP5 = 0.63149399
+
+
+def create_squircle_path(x: float, y: float, width: float, height: float) -> CGPath:
     """
-    Create Apple's continuous curvature rounded rectangle (squircle).
+    Create Apple's continuous curvature rounded rectangle (squircle) as a CGPath.
     Based on PaintCode's reverse-engineering of iOS 7+ UIBezierPath.
     https://www.paintcodeapp.com/news/code-for-ios-7-rounded-rectangles
     """
-    path = NSBezierPath.bezierPath()
-
-    # Apple's magic constant for radius limiting
-    LIMIT_FACTOR = 1.52866483
-
-    # Control point multipliers (relative to limited radius)
-    # These define the continuous curvature Bézier segments
-    TOP_RIGHT_P1 = 1.52866483
-    TOP_RIGHT_P2 = 1.08849323
-    TOP_RIGHT_P3 = 0.86840689
-    TOP_RIGHT_P4 = 0.66993427
-    TOP_RIGHT_P5 = 0.63149399
-    TOP_RIGHT_P6 = 0.37282392
-    TOP_RIGHT_P7 = 0.16906013
-    TOP_RIGHT_P8 = 0.07491176
-
-    TOP_RIGHT_CP1 = 0.06549600
-    TOP_RIGHT_CP2 = 0.07491100
-    TOP_RIGHT_CP3 = 0.16905899
-    TOP_RIGHT_CP4 = 0.37282401
-    TOP_RIGHT_CP5 = 0.63149399
+    path = CGPathCreateMutable()
 
     # For a square icon, use 22% corner radius (Apple standard)
     corner_radius = min(width, height) * 0.22
@@ -61,111 +123,219 @@ def create_squircle_path(x: float, y: float, width: float, height: float) -> NSB
     limited_radius = min(corner_radius, max_radius / LIMIT_FACTOR)
     r = limited_radius
 
+    # Scale the multipliers by the radius once; every point below reuses these
+    r_p1 = r * TOP_RIGHT_P1
+    r_p2 = r * TOP_RIGHT_P2
+    r_p3 = r * TOP_RIGHT_P3
+    r_p4 = r * TOP_RIGHT_P4
+    r_p5 = r * TOP_RIGHT_P5
+    r_p6 = r * TOP_RIGHT_P6
+    r_p7 = r * TOP_RIGHT_P7
+    r_cp1 = r * TOP_RIGHT_CP1
+    r_cp2 = r * TOP_RIGHT_CP2
+    r_cp3 = r * TOP_RIGHT_CP3
+    r_cp4 = r * TOP_RIGHT_CP4
+
     # Calculate corner positions
     left = x
     right = x + width
     top = y + height
     bottom = y
 
+    # Edge/corner junctions and their tangent control points, shared by the
+    # straight edges and the corner segments on either side of them
+    left_p1, left_p2, left_p3 = left + r_p1, left + r_p2, left + r_p3
+    right_p1, right_p2, right_p3 = right - r_p1, right - r_p2, right - r_p3
+    top_p1, top_p2, top_p3 = top - r_p1, top - r_p2, top - r_p3
+    bottom_p1, bottom_p2, bottom_p3 = bottom + r_p1, bottom + r_p2, bottom + r_p3
+
     # Start at the top edge, after top-left corner
-    path.moveToPoint_(NSPoint(left + r * TOP_RIGHT_P1, top))
+    CGPathMoveToPoint(path, None, left_p1, top)
 
     # Top edge (straight line to top-right corner start)
-    path.lineToPoint_(NSPoint(right - r * TOP_RIGHT_P1, top))
+    CGPathAddLineToPoint(path, None, right_p1, top)
 
     # Top-right corner (3 cubic Bézier segments for continuous curvature)
-    path.curveToPoint_controlPoint1_controlPoint2_(
-        NSPoint(right - r * TOP_RIGHT_P4, top - r * TOP_RIGHT_CP1),
-        NSPoint(right - r * TOP_RIGHT_P2, top),
-        NSPoint(right - r * TOP_RIGHT_P3, top),
+    CGPathAddCurveToPoint(
+        path,
+        None,
+        right_p2, top,
+        right_p3, top,
+        right - r_p4, top - r_cp1,
     )
-    path.curveToPoint_controlPoint1_controlPoint2_(
-        NSPoint(right - r * TOP_RIGHT_CP2, top - r * TOP_RIGHT_P5),
-        NSPoint(right - r * TOP_RIGHT_P6, top - r * TOP_RIGHT_CP3),
-        NSPoint(right - r * TOP_RIGHT_P7, top - r * TOP_RIGHT_CP4),
+    CGPathAddCurveToPoint(
+        path,
+        None,
+        right - r_p6, top - r_cp3,
+        right - r_p7, top - r_cp4,
+        right - r_cp2, top - r_p5,
     )
-    path.curveToPoint_controlPoint1_controlPoint2_(
-        NSPoint(right, top - r * TOP_RIGHT_P1),
-        NSPoint(right, top - r * TOP_RIGHT_P3),
-        NSPoint(right, top - r * TOP_RIGHT_P2),
+    CGPathAddCurveToPoint(
+        path,
+        None,
+        right, top_p3,
+        right, top_p2,
+        right, top_p1,
     )
 
     # Right edge
-    path.lineToPoint_(NSPoint(right, bottom + r * TOP_RIGHT_P1))
+    CGPathAddLineToPoint(path, None, right, bottom_p1)
 
     # Bottom-right corner
-    path.curveToPoint_controlPoint1_controlPoint2_(
-        NSPoint(right - r * TOP_RIGHT_CP1, bottom + r * TOP_RIGHT_P4),
-        NSPoint(right, bottom + r * TOP_RIGHT_P2),
-        NSPoint(right, bottom + r * TOP_RIGHT_P3),
+    CGPathAddCurveToPoint(
+        path,
+        None,
+        right, bottom_p2,
+        right, bottom_p3,
+        right - r_cp1, bottom + r_p4,
     )
-    path.curveToPoint_controlPoint1_controlPoint2_(
-        NSPoint(right - r * TOP_RIGHT_P5, bottom + r * TOP_RIGHT_CP2),
-        NSPoint(right - r * TOP_RIGHT_CP3, bottom + r * TOP_RIGHT_P6),
-        NSPoint(right - r * TOP_RIGHT_CP4, bottom + r * TOP_RIGHT_P7),
+    CGPathAddCurveToPoint(
+        path,
+        None,
+        right - r_cp3, bottom + r_p6,
+        right - r_cp4, bottom + r_p7,
+        right - r_p5, bottom + r_cp2,
     )
-    path.curveToPoint_controlPoint1_controlPoint2_(
-        NSPoint(right - r * TOP_RIGHT_P1, bottom),
-        NSPoint(right - r * TOP_RIGHT_P3, bottom),
-        NSPoint(right - r * TOP_RIGHT_P2, bottom),
+    CGPathAddCurveToPoint(
+        path,
+        None,
+        right_p3, bottom,
+        right_p2, bottom,
+        right_p1, bottom,
     )
 
     # Bottom edge
-    path.lineToPoint_(NSPoint(left + r * TOP_RIGHT_P1, bottom))
+    CGPathAddLineToPoint(path, None, left_p1, bottom)
 
     # Bottom-left corner
-    path.curveToPoint_controlPoint1_controlPoint2_(
-        NSPoint(left + r * TOP_RIGHT_P4, bottom + r * TOP_RIGHT_CP1),
-        NSPoint(left + r * TOP_RIGHT_P2, bottom),
-        NSPoint(left + r * TOP_RIGHT_P3, bottom),
+    CGPathAddCurveToPoint(
+        path,
+        None,
+        left_p2, bottom,
+        left_p3, bottom,
+        left + r_p4, bottom + r_cp1,
     )
-    path.curveToPoint_controlPoint1_controlPoint2_(
-        NSPoint(left + r * TOP_RIGHT_CP2, bottom + r * TOP_RIGHT_P5),
-        NSPoint(left + r * TOP_RIGHT_P6, bottom + r * TOP_RIGHT_CP3),
-        NSPoint(left + r * TOP_RIGHT_P7, bottom + r * TOP_RIGHT_CP4),
+    CGPathAddCurveToPoint(
+        path,
+        None,
+        left + r_p6, bottom + r_cp3,
+        left + r_p7, bottom + r_cp4,
+        left + r_cp2, bottom + r_p5,
     )
-    path.curveToPoint_controlPoint1_controlPoint2_(
-        NSPoint(left, bottom + r * TOP_RIGHT_P1),
-        NSPoint(left, bottom + r * TOP_RIGHT_P3),
-        NSPoint(left, bottom + r * TOP_RIGHT_P2),
+    CGPathAddCurveToPoint(
+        path,
+        None,
+        left, bottom_p3,
+        left, bottom_p2,
+        left, bottom_p1,
     )
 
     # Left edge
-    path.lineToPoint_(NSPoint(left, top - r * TOP_RIGHT_P1))
+    CGPathAddLineToPoint(path, None, left, top_p1)
 
     # Top-left corner
-    path.curveToPoint_controlPoint1_controlPoint2_(
-        NSPoint(left + r * TOP_RIGHT_CP1, top - r * TOP_RIGHT_P4),
-        NSPoint(left, top - r * TOP_RIGHT_P2),
-        NSPoint(left, top - r * TOP_RIGHT_P3),
+    CGPathAddCurveToPoint(
+        path,
+        None,
+        left, top_p2,
+        left, top_p3,
+        left + r_cp1, top - r_p4,
     )
-    path.curveToPoint_controlPoint1_controlPoint2_(
-        NSPoint(left + r * TOP_RIGHT_P5, top - r * TOP_RIGHT_CP2),
-        NSPoint(left + r * TOP_RIGHT_CP3, top - r * TOP_RIGHT_P6),
-        NSPoint(left + r * TOP_RIGHT_CP4, top - r * TOP_RIGHT_P7),
+    CGPathAddCurveToPoint(
+        path,
+        None,
+        left + r_cp3, top - r_p6,
+        left + r_cp4, top - r_p7,
+        left + r_p5, top - r_cp2,
     )
-    path.curveToPoint_controlPoint1_controlPoint2_(
-        NSPoint(left + r * TOP_RIGHT_P1, top),
-        NSPoint(left + r * TOP_RIGHT_P3, top),
-        NSPoint(left + r * TOP_RIGHT_P2, top),
+    CGPathAddCurveToPoint(
+        path,
+        None,
+        left_p3, top,
+        left_p2, top,
+        left_p1, top,
     )
 
-    path.closePath()
+    CGPathCloseSubpath(path)
     return path
 
 
-def create_icon(size: int = 1024, foreground_only: bool = False) -> NSImage:
-    """Create the app icon using SF Symbols mic.fill
+# The squircle's shape is size-independent (corner radius scales with the side), so
+# build it once in unit coordinates and scale it at draw time
+UNIT_SQUIRCLE_PATH = create_squircle_path(0, 0, 1, 1)
+
+
+@functools.lru_cache(maxsize=16)
+def configured_symbol(point_size: float) -> Optional[Tuple[CGImage, float, float]]:
+    """Return SF Symbol mic.fill configured for the given point size (cached)
+
+    Returns (CGImage, width, height) with the size to draw it at: the CGImage's pixel
+    dimensions when it was rendered at 1x, otherwise the symbol's point size. Returns
+    None if the symbol is unavailable.
+    """
+    symbol_name = "mic.fill"
+    symbol_image = NSImage.imageWithSystemSymbolName_accessibilityDescription_(
+        symbol_name, None
+    )
+    if not symbol_image:
+        return None
+
+    size_config = NSImageSymbolConfiguration.configurationWithPointSize_weight_(
+        point_size, NSFontWeightHeavy
+    )
+
+    combined_config = size_config.configurationByApplyingConfiguration_(
+        SYMBOL_COLOR_CONFIG
+    )
+    configured = symbol_image.imageWithSymbolConfiguration_(combined_config)
+    symbol_image = configured or symbol_image
+
+    # Convert to a CGImage once per size, rendered at 1x (identity CTM) so one point
+    # maps to one pixel of the icon bitmap. The pixel size is rounded up from the
+    # point size, so report the CGImage's own dimensions for drawing it 1:1
+    symbol_cgimage, _ = symbol_image.CGImageForProposedRect_context_hints_(
+        None, None, {NSImageHintCTM: NSAffineTransform.transform()}
+    )
+    if symbol_cgimage is None:
+        return None
+
+    symbol_size = symbol_image.size()
+    pixel_width = CGImageGetWidth(symbol_cgimage)
+    pixel_height = CGImageGetHeight(symbol_cgimage)
+    if (pixel_width, pixel_height) != (
+        math.ceil(symbol_size.width),
+        math.ceil(symbol_size.height),
+    ):
+        # A backing scale factor leaked in despite the identity CTM hint; drawing the
+        # bitmap at its pixel size would enlarge the mic, so scale it into the point rect
+        return symbol_cgimage, symbol_size.width, symbol_size.height
+
+    return symbol_cgimage, pixel_width, pixel_height
+
+
+def create_icon(size: int = 1024, foreground_only: bool = False) -> CGImage:
+    """Create the app icon using SF Symbols mic.fill, returned as a CGImage
 
     Args:
         size: Canvas size in pixels
         foreground_only: If True, output only the mic symbol with transparent background
                          (for use with Icon Composer / macOS 26 Liquid Glass)
     """
-    image = NSImage.alloc().initWithSize_(NSSize(size, size))
-    image.lockFocus()
-
-    ctx = NSGraphicsContext.currentContext()
+    # Explicit RGBA8 bitmap: exactly size x size pixels, independent of the
+    # screen's backing scale factor and color space (unlike NSImage.lockFocus)
+    cg_ctx = CGBitmapContextCreate(
+        None,
+        size,
+        size,
+        8,
+        0,
+        CGColorSpaceCreateDeviceRGB(),
+        kCGColorSpaceGenericRGB,
+    kCGImageAlphaPremultipliedLast,
+    )
+    ctx = NSGraphicsContext.graphicsContextWithCGContext_flipped_(cg_ctx, False)
+    NSGraphicsContext.saveGraphicsState()
+    NSGraphicsContext.setCurrentContext_(ctx)
     ctx.setShouldAntialias_(True)
 
     # macOS standard: 832x832 icon within 1024x1024 canvas (96px margin each side)
@@ -174,80 +344,98 @@ def create_icon(size: int = 1024, foreground_only: bool = False) -> NSImage:
     margin = (size - icon_size) / 2  # 96px at 1024 canvas
 
     if not foreground_only:
-        # Use proper Apple squircle (continuous curvature) instead of simple rounded rect
-        bg_path = create_squircle_path(margin, margin, icon_size, icon_size)
-
-        # Top gradient overlay for subtle 3D effect
-        top_gradient = NSGradient.alloc().initWithStartingColor_endingColor_(
-            NSColor.colorWithCalibratedRed_green_blue_alpha_(1, 1, 1, 1.0),
-            NSColor.colorWithCalibratedRed_green_blue_alpha_(0.95, 0.95, 0.95, 1.0),
+        # Use proper Apple squircle (continuous curvature) instead of simple rounded rect,
+        # mapping the cached unit path onto the background rect
+        CGContextSaveGState(cg_ctx)
+        CGContextTranslateCTM(cg_ctx, margin, margin)
+        CGContextScaleCTM(cg_ctx, icon_size, icon_size)
+        CGContextAddPath(cg_ctx, UNIT_SQUIRCLE_PATH)
+
+        if size >= 512:
+            # Top gradient overlay for subtle 3D effect, bottom to top across the unit box
+            CGContextClip(cg_ctx)
+            CGContextDrawLinearGradient(cg_ctx, BACKGROUND_GRADIENT, (0, 0), (0, 1), 0)
+        else:
+            # The 5% white-to-gray ramp is imperceptible at small sizes; a flat fill
+            # at its midpoint looks the same and skips the per-pixel gradient
+            CGContextSetFillColorWithColor(cg_ctx, BACKGROUND_FLAT_COLOR)
+            CGContextFillPath(cg_ctx)
+
+        CGContextRestoreGState(cg_ctx)
+
+    # Symbol size proportional to background (52% of 832 = ~42% of 1024)
+    symbol = configured_symbol(icon_size * 0.52)
+
+    if symbol:
+        # Normally the bitmap's own pixel size: drawn on a whole-pixel origin, the
+        # symbol is copied 1:1 instead of resampled (which blurs small icons)
+        symbol_cgimage, symbol_width, symbol_height = symbol
+        # Center symbol within the background rect, not the full canvas
+        x = round(margin + (icon_size - symbol_width) / 2)
+        y = round(margin + (icon_size - symbol_height) / 2)
+
+        # Composite the symbol's CGImage straight into the bitmap context instead of
+        # going through NSImage drawing and its intermediate cached representation
+        CGContextDrawImage(
+            cg_ctx,
+            CGRectMake(x, y, symbol_width, symbol_height),
+            symbol_cgimage,
         )
-        top_gradient.drawInBezierPath_angle_(bg_path, 90)
 
-    # SF Symbol: mic.fill
-    symbol_name = "mic.fill"
-    symbol_image = NSImage.imageWithSystemSymbolName_accessibilityDescription_(
-        symbol_name, None
-    )
+    NSGraphicsContext.restoreGraphicsState()
+    return CGBitmapContextCreateImage(cg_ctx)
 
-    if symbol_image:
-        # Symbol size proportional to background (52% of 832 = ~42% of 1024)
-        symbol_point_size = icon_size * 0.52
-        size_config = NSImageSymbolConfiguration.configurationWithPointSize_weight_(
-            symbol_point_size, NSFontWeightHeavy
-        )
 
-        dark_gray = NSColor.colorWithCalibratedRed_green_blue_alpha_(
-            0.18, 0.18, 0.18, 1.0
-        )
-        color_config = NSImageSymbolConfiguration.configurationWithHierarchicalColor_(
-            dark_gray
-        )
+def catalog_sizes(contents_path: Path) -> List[Tuple[int, str]]:
+    """Return (pixel size, filename) pairs for the images an asset catalog references
 
-        combined_config = size_config.configurationByApplyingConfiguration_(
-            color_config
-        )
-        configured_symbol = symbol_image.imageWithSymbolConfiguration_(combined_config)
-        if configured_symbol:
-            symbol_image = configured_symbol
+    Slots without a filename are unused and skipped; a file referenced by several
+    slots (e.g. 16pt@2x and 32pt@1x) is listed once.
+    """
+    with open(contents_path) as f:
+        images = json.load(f)["images"]
+
+    files = {}
+    for image in images:
+        filename = image.get("filename")
+        if not filename:
+            continue
+        points = float(image["size"].split("x")[0])
+        scale = int(image.get("scale", "1x").rstrip("x"))
+        files[filename] = round(points * scale)
+    return sorted((size, filename) for filename, size in files.items())
+
+
+def save_png(image: CGImage, path: Path) -> Tuple[int, int]:
+    """Save CGImage as PNG, returning its pixel dimensions"""
+    # Encode straight from the CGImage; "public.png" is kUTTypePNG. The CFURL is
+    # built from the raw path bytes to avoid an NSString/NSURL round-trip
+    path_bytes = os.fsencode(path)
+    url = CFURLCreateFromFileSystemRepresentation(
+        None, path_bytes, len(path_bytes), False
+    )
+    dest = CGImageDestinationCreateWithURL(url, "public.png", 1, None)
+    properties = {
+        kCGImagePropertyPNGDictionary: {
+            kCGImagePropertyPNGCompressionFilter: PNG_FILTER_NONE,
+        },
+    }
+    CGImageDestinationAddImage(dest, image, properties)
+    if not CGImageDestinationFinalize(dest):
+        raise RuntimeError(f"Failed to write {path}")
 
-        symbol_size = symbol_image.size()
-        # Center symbol within the background rect, not the full canvas
-        x = margin + (icon_size - symbol_size.width) / 2
-        y = margin + (icon_size - symbol_size.height) / 2
-
-        symbol_image.drawAtPoint_fromRect_operation_fraction_(
-            NSPoint(x, y),
-            NSMakeRect(0, 0, symbol_size.width, symbol_size.height),
-            NSCompositingOperationSourceOver,
-            1.0,
-        )
+    return CGImageGetWidth(image), CGImageGetHeight(image)
 
-    image.unlockFocus()
-    return image
-
-
-def save_png(image: NSImage, path: Path, size: int):
-    """Save NSImage as PNG at specified size"""
-    if size != 1024:
-        resized = NSImage.alloc().initWithSize_(NSSize(size, size))
-        resized.lockFocus()
-        NSGraphicsContext.currentContext().setImageInterpolation_(3)
-        image.drawInRect_fromRect_operation_fraction_(
-            NSMakeRect(0, 0, size, size),
-            NSMakeRect(0, 0, 1024, 1024),
-            NSCompositingOperationSourceOver,
-            1.0,
-        )
-        resized.unlockFocus()
-        image = resized
 
-    tiff_data = image.TIFFRepresentation()
-    bitmap = NSBitmapImageRep.imageRepWithData_(tiff_data)
-    png_data = bitmap.representationUsingType_properties_(NSPNGFileType, None)
+def write_icon(path: Path, size: int, foreground_only: bool = False) -> Tuple[int, int]:
+    """Render the icon at size and save it as PNG, returning its pixel dimensions
 
-    png_data.writeToFile_atomically_(str(path), True)
-    print(f"  Created: {path.name} ({size}x{size})")
+    Drawing goes into the icon's own bitmap context, so this is safe to run on a
+    worker thread. The autorelease pool drains each render's temporaries as soon as
+    its PNG is written (worker threads have no pool of their own).
+    """
+    with objc.autorelease_pool():
+        return save_png(create_icon(size, foreground_only=foreground_only), path)
 
 
 def main():
@@ -269,10 +457,9 @@ def main():
         output_dir.mkdir(parents=True, exist_ok=True)
 
         print("Creating foreground layer (mic symbol only) for Icon Composer...")
-        icon = create_icon(1024, foreground_only=True)
-
         output_path = output_dir / "appicon_foreground.png"
-        save_png(icon, output_path, 1024)
+        width, height = write_icon(output_path, 1024, foreground_only=True)
+        print(f"  Created: {output_path.name} ({width}x{height})")
 
         print(f"\nForeground layer saved to: {output_path}")
         print("\nNext steps:")
@@ -286,14 +473,27 @@ def main():
         output_dir.mkdir(parents=True, exist_ok=True)
 
         print("Creating icon with SF Symbol 'mic.fill'...")
-        icon = create_icon(1024)
-
-        sizes = [16, 32, 64, 128, 256, 512, 1024]
+        # Only render the files the asset catalog actually references. A new or
+        # emptied catalog has no filenames yet, so generate the default set instead
+        contents_path = output_dir / "Contents.json"
+        icons = catalog_sizes(contents_path) if contents_path.exists() else []
+        if not icons:
+            icons = [
+                (size, f"appicon_{size}.png") for size in [16, 32, 64, 128, 256, 512, 1024]
+            ]
 
         print("\nGenerating PNG icons...")
-        for size in sizes:
-            output_path = output_dir / f"appicon_{size}.png"
-            save_png(icon, output_path, size)
+        # Render each size natively from the vector artwork (sharp small icons, no
+        # downsampling). Each worker renders its size only when it is about to encode
+        # it; PyObjC releases the GIL inside CoreGraphics/ImageIO, so sizes run in parallel
+        with ThreadPoolExecutor(max_workers=min(len(icons), os.cpu_count() or 1)) as executor:
+            futures = {
+                filename: executor.submit(write_icon, output_dir / filename, size)
+                for size, filename in icons
+            }
+            for filename, future in futures.items():
+                width, height = future.result()
+                print(f"  Created: {filename} ({width}x{height})")
 
         print("\nAll icons generated successfully!")
 